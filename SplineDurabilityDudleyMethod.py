@@ -7,10 +7,591 @@ Created on Fri Mar 16 11:48:46 2018
 
 """
 
+import math
+from bisect import bisect_right
+from collections import namedtuple
+from enum import IntEnum
+from functools import lru_cache, wraps
 import numpy as np
-from BaseCalculations.UnitConverter import PressureConverter,\
-                                            LengthConverter
-from nose.tools import assert_almost_equals, assert_equals
+try:
+    from numba import njit, prange, vectorize
+    
+    @njit(cache=True)
+    def _bucket(limits,x):
+        """Index of the table bucket holding a single value, as \
+        ``numpy.searchsorted(limits,x,side='right')``
+        
+        """
+        return np.searchsorted(limits,x,side='right')
+    #end def
+except ImportError:
+    prange = range
+    
+    def _bucket(limits,x):
+        """Stand in for the compiled bucket look up when numba is not \
+        installed, bisecting a single value in plain Python is much cheaper \
+        than a call to :func:`numpy.searchsorted`
+        
+        """
+        return bisect_right(limits,x)
+    #end def
+    
+    def njit(*args,**kwargs):
+        """Stand in for :func:`numba.njit` when numba is not installed, the \
+        decorated function is left as plain Python
+        
+        """
+        return lambda func: func
+    #end def
+    
+    def vectorize(*args,**kwargs):
+        """Stand in for :func:`numba.vectorize` when numba is not installed, \
+        the decorated function runs as plain Python on its arguments as \
+        float arrays, which NumPy broadcasts
+        
+        """
+        def decorator(func):
+            @wraps(func)
+            def ufunc(*funcArgs):
+                return func(*[np.asarray(a,dtype=float) for a in funcArgs])
+            #end def
+            return ufunc
+        #end def
+        return decorator
+    #end def
+#end try
+
+class HType(IntEnum):
+    """Integer codes for the hardness measurement types
+    
+    """
+    BRINELL = 0
+    ROCKWELL_C = 1
+#end class
+
+class ToothEnd(IntEnum):
+    """Integer codes for the tooth end designs
+    
+    """
+    STRAIGHT = 0
+    CROWNED = 1
+#end class
+
+#: Hardness type names as used through the calculation and GUI
+_HTYPE_NAMES = {'Brinell':HType.BRINELL,'Rockwell C':HType.ROCKWELL_C}
+#: Tooth end names as used through the calculation and GUI
+_TOOTHEND_NAMES = {'Straight':ToothEnd.STRAIGHT,'Crowned':ToothEnd.CROWNED}
+
+def _hardnessTypeCode(hType):
+    """Resolve a hardness type name, e.g. 'Rockwell C', or code to a \
+    :class:`HType`
+    
+    :param hType: The type of hardness measurement used
+    :type hType: str or HType
+    
+    :returns: Returns the hardness type code
+    :rtype: HType
+    
+    """
+    try:
+        return HType(_HTYPE_NAMES.get(hType,hType))
+    except (ValueError,TypeError):
+        raise UnrecognisedHardnessTypeException()
+    #end try
+#end def
+
+def _toothEndCode(toothEnd):
+    """Resolve a tooth end name, e.g. 'Crowned', or code to a \
+    :class:`ToothEnd`
+    
+    :param toothEnd: Design of the tooth end
+    :type toothEnd: str or ToothEnd
+    
+    :returns: Returns the tooth end code
+    :rtype: ToothEnd
+    
+    """
+    try:
+        return ToothEnd(_TOOTHEND_NAMES.get(toothEnd,toothEnd))
+    except (ValueError,TypeError):
+        raise UnrecognisedToothEndException()
+    #end try
+#end def
+
+def _checkShockTypes(supplyShockType,loadShockType):
+    """Check that the shock type codes index the application factor table, \
+    the compiled kernels do not bounds check the look up
+    
+    :param supplyShockType: Number representing a specific supply shock type
+    :param loadShockType: Number representing a specific load type
+    
+    :type supplyShockType: int or numpy.ndarray
+    :type loadShockType: int or numpy.ndarray
+    
+    """
+    nSupply,nLoad = _APPLICATION_FACTORS.shape
+    if isinstance(supplyShockType,(int,np.integer)) and \
+            isinstance(loadShockType,(int,np.integer)):
+        valid = 0 <= supplyShockType < nSupply and \
+            0 <= loadShockType < nLoad
+    else:
+        valid = np.all(np.isin(supplyShockType,np.arange(nSupply))) and \
+            np.all(np.isin(loadShockType,np.arange(nLoad)))
+    #end if
+    if not valid:
+        raise UnrecognisedShockTypeException()
+    #end if
+#end def
+
+def _checkTableRanges(hardness,hTypeCode,nTotal,flexible):
+    """Check that the hardness and total revolutions fall within the look \
+    up tables of a single spline, beyond them the tables hold NaN
+    
+    :param hardness: Hardness of the spline teeth
+    :param hTypeCode: The type of hardness measurement used
+    :param nTotal: Total number of revolutions in the spline life
+    :param flexible: Whether the spline is flexible
+    
+    :type hardness: float
+    :type hTypeCode: HType
+    :type nTotal: float
+    :type flexible: boolean
+    
+    """
+    if not hardness < _HARDNESS_MAXIMA[hTypeCode]:
+        raise HardnessOutOfRangeException()
+    #end if
+    if flexible and not nTotal < _WEAR_REVS[-1]:
+        raise WearLifeOutOfRangeException()
+    #end if
+#end def
+
+### Look up tables - stresses are held in Pa
+#: Conversion from psi to Pa
+_PSI_TO_PA = 6894.757293168361
+#: Conversion from m to inch
+_M_TO_INCH = 1./0.0254
+#: Constant of the shaft torsional stress, :math:`16/\pi`
+_16_OVER_PI = 16./math.pi
+#: Spline application factor, :math:`K_a`, indexed [supply, load]
+_APPLICATION_FACTORS = np.array([[1.,1.2,1.5,1.8],\
+                                 [1.2,1.3,1.8,2.1],\
+                                 [2.,2.2,2.4,2.8]])
+#: Torque cycle limits for the life factor, :math:`L_f`
+_LIFE_CYCLES = np.array([1.0e3,1.0e4,1.0e5,1.0e6])
+#: Life factor, :math:`L_f`, indexed [reversible, cycle bucket]
+_LIFE_FACTORS = np.array([[1.8,1.0,0.5,0.4,0.3],\
+                          [1.8,1.0,0.4,0.3,0.2]])
+#: Revolution limits for the wear life factor, :math:`L_w`
+_WEAR_REVS = np.array([1.0e4,1.0e5,1.0e6,1.0e7,1.0e8,1.0e9,1.0e10])
+#: Wear life factor, :math:`L_w`, by revolution bucket
+_WEAR_FACTORS = np.array([4.,2.8,2.,1.4,1.,0.7,0.5,np.nan])
+#: Cycle and revolution limits as tuples, for bisecting scalar inputs
+_LIFE_CYCLES_TUPLE = tuple(_LIFE_CYCLES)
+_WEAR_REVS_TUPLE = tuple(_WEAR_REVS)
+#: Misalignment limits for the load distribution factor, :math:`K_m`
+_KM_MISALIGNMENT = np.array([0.001,0.002,0.004,0.008])
+#: Face width limits for the load distribution factor, :math:`K_m` [m]
+_KM_FACE_WIDTH = np.array([12.7e-3,25.4e-3,50.8e-3,101.e-3])
+#: Load distribution factor, :math:`K_m`, indexed [misalignment, face width]
+_KM_TABLE = np.array([[1.,1.,1.,1.5],\
+                      [1.,1.,1.5,2.],\
+                      [1.,1.5,2.,2.5],\
+                      [1.5,2.,2.5,3.]])
+#: Brinell hardness limits common to all the allowable stress tables
+_BRINELL_LIMITS = np.array([200.,260.,351.])
+#: Rockwell C hardness limits for the allowable shear stress
+_SHEAR_ROCKWELL_LIMITS = np.array([38.,46.,53.,63.])
+#: Allowable shear stress by hardness bucket [Pa]
+_SHEAR_BRINELL = _PSI_TO_PA*np.array([20000.,30000.,40000.,np.nan])
+_SHEAR_ROCKWELL = _PSI_TO_PA*np.array([40000.,45000.,40000.,50000.,np.nan])
+#: Hardness limits for the allowable compressive stress, indexed [HType]
+_COMP_LIMITS = np.array([[200.,260.,351.],\
+                         [38.,53.,63.]])
+#: Allowable compressive stress [Pa], indexed [HType, ToothEnd, bucket]
+_COMP_STRESS = _PSI_TO_PA*np.array([[[1500.,2000.,3000.,np.nan],\
+                                     [6000.,8000.,12000.,np.nan]],\
+                                    [[3000.,4000.,5000.,np.nan],\
+                                     [12000.,16000.,20000.,np.nan]]])
+#: Rockwell C hardness limits for the allowable bursting stress
+_BURST_ROCKWELL_LIMITS = np.array([46.,53.,63.])
+#: Allowable bursting stress by hardness bucket [Pa]
+_BURST_BRINELL = _PSI_TO_PA*np.array([22000.,32000.,45000.,np.nan])
+_BURST_ROCKWELL = _PSI_TO_PA*np.array([45000.,50000.,55000.,np.nan])
+#: Allowable shear tables and limits, indexed by HType
+_SHEAR_LIMITS = (_BRINELL_LIMITS,_SHEAR_ROCKWELL_LIMITS)
+_SHEAR_STRESS = (_SHEAR_BRINELL,_SHEAR_ROCKWELL)
+#: Allowable bursting tables and limits, indexed by HType
+_BURST_LIMITS = (_BRINELL_LIMITS,_BURST_ROCKWELL_LIMITS)
+_BURST_STRESS = (_BURST_BRINELL,_BURST_ROCKWELL)
+#: Hardness from which the allowable stress tables hold NaN, indexed by HType
+_HARDNESS_MAXIMA = (min(_BRINELL_LIMITS[-1],_COMP_LIMITS[0,-1]),\
+                    min(_SHEAR_ROCKWELL_LIMITS[-1],_COMP_LIMITS[1,-1],\
+                        _BURST_ROCKWELL_LIMITS[-1]))
+
+### Cached look ups - the discrete inputs repeat heavily in design sweeps,
+#array inputs, 0-d included, are unhashable so bypass the cache
+def _isArray(*values):
+    """Check whether any of the values is an array or array like, \
+    including 0-d arrays, rather than a hashable scalar
+    
+    :returns: Returns True if any value is an array
+    :rtype: bool
+    
+    """
+    for value in values:
+        if isinstance(value,np.ndarray) or np.ndim(value):
+            return True
+        #end if
+    #end for
+    return False
+#end def
+
+def _unwrapScalars(values):
+    """Convert any 0-d array values to Python scalars so that they can be \
+    hashed
+    
+    :param values: The values to convert
+    :type values: tuple
+    :returns: Returns the values with 0-d arrays replaced by their scalars
+    :rtype: tuple
+    
+    """
+    return tuple([v.item() if isinstance(v,np.ndarray) and not v.ndim else v\
+                  for v in values])
+#end def
+
+@lru_cache(maxsize=None)
+def _applicationFactor(supplyShockType,loadShockType):
+    """Look up the spline application factor, :math:`K_a`, see \
+    :meth:`DudleyMethodSpline.getSplineApplicationFactor`
+    
+    """
+    return float(_APPLICATION_FACTORS[supplyShockType,loadShockType])
+#end def
+
+@lru_cache(maxsize=16)
+def _lifeFactor(nCyc,reversible):
+    """Look up the life factor, :math:`L_f`, see \
+    :meth:`DudleyMethodSpline.getLifeFactor`
+    
+    """
+    return _LIFE_FACTORS[int(reversible),\
+                         bisect_right(_LIFE_CYCLES_TUPLE,nCyc)]
+#end def
+
+@lru_cache(maxsize=16)
+def _wearLifeFactor(nCyc):
+    """Look up the spline wear life factor, :math:`L_w`, see \
+    :meth:`DudleyMethodSpline.getSplineWearLifeFactor`
+    
+    """
+    return _WEAR_FACTORS[bisect_right(_WEAR_REVS_TUPLE,nCyc)]
+#end def
+
+@lru_cache(maxsize=64)
+def _allowableShearStress(hardness,hType):
+    """Look up the allowable shear stress, see \
+    :meth:`DudleyMethodSpline.getAllowableShearStressByHardness`
+    
+    """
+    hType = _hardnessTypeCode(hType)
+    return _SHEAR_STRESS[hType][np.searchsorted(_SHEAR_LIMITS[hType],\
+                                                hardness,\
+                                                side='right')]
+#end def
+
+@lru_cache(maxsize=64)
+def _allowableCompressiveStress(hardness,hType,toothEnd):
+    """Look up the allowable compressive stress, see \
+    :meth:`DudleyMethodSpline.getAllowableCompressiveStressForSplines`
+    
+    """
+    toothEnd = _toothEndCode(toothEnd)
+    hType = _hardnessTypeCode(hType)
+    return _COMP_STRESS[hType,\
+                        toothEnd,\
+                        np.searchsorted(_COMP_LIMITS[hType],\
+                                        hardness,\
+                                        side='right')]
+#end def
+
+@lru_cache(maxsize=64)
+def _allowableBurstingStress(hardness,hType):
+    """Look up the allowable bursting stress, see \
+    :meth:`DudleyMethodSpline.getAllowableBurstingStressByHardness`
+    
+    """
+    hType = _hardnessTypeCode(hType)
+    return _BURST_STRESS[hType][np.searchsorted(_BURST_LIMITS[hType],\
+                                                hardness,\
+                                                side='right')]
+#end def
+
+@vectorize(['float64(float64,float64)'],target='parallel',cache=True)
+def _solidShaftStressV(t,dRe):
+    """Element-wise solid shaft stress, see \
+    :meth:`DudleyMethodSpline.solidShaftStress`
+    
+    """
+    return _16_OVER_PI*t/(dRe*dRe*dRe)
+#end def
+
+@vectorize(['float64(float64,float64,float64)'],target='parallel',cache=True)
+def _hollowShaftStressV(t,dRe,dH):
+    """Element-wise hollow shaft stress, see \
+    :meth:`DudleyMethodSpline.hollowShaftStress`
+    
+    """
+    dRe2 = dRe*dRe
+    dH2 = dH*dH
+    return _16_OVER_PI*t*dRe/(dRe2*dRe2-dH2*dH2)
+#end def
+
+def _select(condition,ifTrue,ifFalse):
+    """Element-wise choice between two branches, as :func:`numpy.where`, \
+    but only evaluating a branch when some element takes it. Sweeps \
+    commonly take the same branch throughout.
+    
+    :param condition: Boolean array choosing the branch
+    :param ifTrue: Function returning the values where condition is true
+    :param ifFalse: Function returning the values where condition is false
+    
+    :type condition: numpy.ndarray
+    :type ifTrue: function
+    :type ifFalse: function
+    
+    :returns: Returns the chosen values
+    :rtype: numpy.ndarray
+    
+    """
+    if condition.all():
+        return ifTrue()
+    elif not condition.any():
+        return ifFalse()
+    #end if
+    return np.where(condition,ifTrue(),ifFalse())
+#end def
+
+#: Fast maths flags for the compiled kernels - NaN and infinity are kept
+#: as the look up tables return NaN outside of their range
+_FASTMATH = {'arcp','contract','reassoc'}
+
+@njit(cache=True,fastmath=_FASTMATH)
+def _dudleyCore(t,dRe,dH,supplyShockType,loadShockType,n,nCyc,nTotal,\
+                hardness,hTypeCode,d,z,fE,tC,relativeMisalignment,h,phi,\
+                tW,f,dOi,dRi,reversible,toothEndCode,flexible,y):
+    """Fused calculation of the Dudley method for a single spline
+    
+    Takes the same inputs as :class:`DudleyMethodSpline`, with the hardness \
+    type and tooth end given as :class:`HType` and :class:`ToothEnd` codes, \
+    and evaluates all the stages of :meth:`DudleyMethodSpline.calculate` \
+    inline. Compiled with numba when it is available.
+    
+    :returns: Returns the shaft stress, application factor, life factor, \
+    allowable shear stress, maximum shaft stress, shaft safety factor, load \
+    distribution factor, teeth shear stress, maximum teeth shear stress, \
+    teeth safety factor, compressive stress, allowable compressive stress, \
+    wear life factor (NaN if not flexible), factored compressive stress, \
+    compressive safety factor, the radial, centrifugal, tensile and total \
+    bursting stresses, allowable bursting stress and bursting safety factor
+    :rtype: tuple
+    
+    """
+    if dH == 0.0:
+        shaftStress = _16_OVER_PI*t/(dRe*dRe*dRe)
+    else:
+        dRe2 = dRe*dRe
+        dH2 = dH*dH
+        shaftStress = _16_OVER_PI*t*dRe/(dRe2*dRe2-dH2*dH2)
+    #end if
+    appFactor = _APPLICATION_FACTORS[supplyShockType,loadShockType]
+    splineLF = _LIFE_FACTORS[int(reversible),\
+                             _bucket(_LIFE_CYCLES,nCyc)]
+    if hTypeCode == 0:
+        bucket = _bucket(_BRINELL_LIMITS,hardness)
+        allowShaftStress = _SHEAR_BRINELL[bucket]
+        allowBurstStress = _BURST_BRINELL[bucket]
+    else:
+        allowShaftStress = _SHEAR_ROCKWELL[\
+            _bucket(_SHEAR_ROCKWELL_LIMITS,hardness)]
+        allowBurstStress = _BURST_ROCKWELL[\
+            _bucket(_BURST_ROCKWELL_LIMITS,hardness)]
+    #end if
+    allowCompStress = _COMP_STRESS[hTypeCode,toothEndCode,\
+        _bucket(_COMP_LIMITS[hTypeCode],hardness)]
+    stressMultiplier = appFactor/splineLF
+    maxShaftStress = shaftStress*stressMultiplier
+    shaftSafetyFactor = allowShaftStress/maxShaftStress
+    kM = _KM_TABLE[min(_bucket(_KM_MISALIGNMENT,relativeMisalignment),3),\
+                   min(_bucket(_KM_FACE_WIDTH,fE),3)]
+    toothLoad = t*kM/(d*z*fE)
+    teethShearStress = 4.*toothLoad/tC
+    maxTeethShearStress = teethShearStress*stressMultiplier
+    teethSafetyFactor = allowShaftStress/maxTeethShearStress
+    compStress = 2.*toothLoad/h
+    if flexible:
+        lifeWear = _WEAR_FACTORS[_bucket(_WEAR_REVS,nTotal)]
+        factoredCompStress = compStress*appFactor/lifeWear
+    else:
+        lifeWear = np.nan
+        factoredCompStress = compStress*appFactor/(9.*splineLF)
+    #end if
+    compSafetyFactor = allowCompStress/factoredCompStress
+    burstRad = t*math.tan(phi)/(math.pi*d*tW*f)
+    dOiInch = dOi*_M_TO_INCH
+    dRiInch = dRi*_M_TO_INCH
+    burstCentrifugal = _PSI_TO_PA*0.828e-6*n*n*\
+        (2.*dOiInch*dOiInch+0.424*dRiInch*dRiInch)
+    burstTens = (4.*t)/(d*d*fE*y)
+    burstTotal = appFactor*kM*(burstRad+burstTens)+burstCentrifugal
+    burstSafetyFactor = allowBurstStress*splineLF/burstTotal
+    return (shaftStress,appFactor,splineLF,allowShaftStress,maxShaftStress,\
+            shaftSafetyFactor,kM,teethShearStress,maxTeethShearStress,\
+            teethSafetyFactor,compStress,allowCompStress,lifeWear,\
+            factoredCompStress,compSafetyFactor,burstRad,burstCentrifugal,\
+            burstTens,burstTotal,allowBurstStress,burstSafetyFactor)
+#end def
+
+#: Results of the Dudley method for a single spline, in the order returned
+#: by :func:`_dudleyCore`
+_DudleyResult = namedtuple('_DudleyResult',\
+                           ['shaftStress',\
+                            'appFactor',\
+                            'splineLF',\
+                            'allowShaftStress',\
+                            'maxShaftStress',\
+                            'shaftSafetyFactor',\
+                            'teethLoadkM',\
+                            'teethShearStress',\
+                            'maxTeethShearStress',\
+                            'teethSafetyFactor',\
+                            'compStress',\
+                            'allowCompStress',\
+                            'lifeWear',\
+                            'factoredCompStress',\
+                            'compSafetyFactor',\
+                            'burstRad',\
+                            'burstCentrifugal',\
+                            'burstTens',\
+                            'burstTotal',\
+                            'allowBurstStress',\
+                            'burstSafetyFactor'])
+
+@lru_cache(maxsize=4096)
+def _dudleyCompute(t,dRe,dH,supplyShockType,loadShockType,n,nCyc,nTotal,\
+                   hardness,hType,d,z,fE,tC,relativeMisalignment,h,phi,\
+                   tW,f,dOi,dRi,reversible,toothEnd,flexible,y):
+    """Cached evaluation of :func:`_dudleyCore`, design sweeps revisit the \
+    same set of inputs many times
+    
+    Takes the same inputs as :func:`_dudleyCore`, except that the hardness \
+    type and tooth end may be names or codes. These and the shock types \
+    are checked before the compiled kernel, which does not bounds check \
+    its look ups, is called. The hardness and total revolutions are \
+    checked against the table ranges so that no safety factor is NaN.
+    
+    :returns: Returns the results of the Dudley method
+    :rtype: _DudleyResult
+    
+    """
+    _checkShockTypes(supplyShockType,loadShockType)
+    hTypeCode = _hardnessTypeCode(hType)
+    _checkTableRanges(hardness,hTypeCode,nTotal,flexible)
+    return _DudleyResult(*_dudleyCore(t,dRe,dH,supplyShockType,\
+                                      loadShockType,n,nCyc,nTotal,hardness,\
+                                      int(hTypeCode),d,z,fE,\
+                                      tC,relativeMisalignment,h,phi,tW,f,\
+                                      dOi,dRi,reversible,\
+                                      int(_toothEndCode(toothEnd)),\
+                                      flexible,y))
+#end def
+
+def _batchCodes(values,names,exception):
+    """Map an array of hardness type or tooth end names or codes to \
+    integer codes
+    
+    :param values: Names or codes, one per spline
+    :param names: Mapping of the recognised names to their codes
+    :param exception: Exception class raised for unrecognised values
+    
+    :type values: numpy.ndarray
+    :type names: dict
+    :type exception: type
+    
+    :returns: Returns the codes
+    :rtype: numpy.ndarray
+    
+    """
+    if values.dtype.kind in 'iu':
+        codes = values.astype(np.int64)
+    else:
+        codes = np.full(values.shape,-1,dtype=np.int64)
+        for name,code in names.items():
+            codes[values == name] = code
+        #end for
+    #end if
+    if not np.all(np.isin(codes,list(names.values()))):
+        raise exception()
+    #end if
+    return codes
+#end def
+
+def _batchInputs(arrays):
+    """Fill in the optional batch inputs and broadcast them together, see \
+    :meth:`DudleyMethodSpline.calculateBatch`
+    
+    :param arrays: Inputs keyed by the constructor argument names
+    :type arrays: dict or pandas.DataFrame
+    
+    :returns: Returns the broadcast inputs as arrays of a common shape, \
+    with the hardness types and tooth ends as integer codes
+    :rtype: dict
+    
+    """
+    inp = {'dH':0.0,\
+           'hType':'Brinell',\
+           'reversible':False,\
+           'toothEnd':'Straight',\
+           'flexible':True,\
+           'y':1.5}
+    inp.update(arrays)
+    keys = list(inp.keys())
+    inp = dict(zip(keys,np.broadcast_arrays(*[np.asarray(inp[k]) \
+                                              for k in keys])))
+    inp['hType'] = _batchCodes(inp['hType'],\
+                               _HTYPE_NAMES,\
+                               UnrecognisedHardnessTypeException)
+    inp['toothEnd'] = _batchCodes(inp['toothEnd'],\
+                                  _TOOTHEND_NAMES,\
+                                  UnrecognisedToothEndException)
+    _checkShockTypes(inp['supplyShockType'],inp['loadShockType'])
+    return inp
+#end def
+
+@njit(parallel=True,cache=True,fastmath=_FASTMATH)
+def _dudleyBatch(t,dRe,dH,supplyShockType,loadShockType,n,nCyc,nTotal,\
+                 hardness,hTypeCode,d,z,fE,tC,relativeMisalignment,h,phi,\
+                 tW,f,dOi,dRi,reversible,toothEndCode,flexible,y,out):
+    """Evaluate :func:`_dudleyCore` for every sample of 1-D input arrays, \
+    the samples are independent so are spread over the available cores
+    
+    :param out: Output array of shape (samples, fields of \
+    :class:`_DudleyResult`), filled in place
+    
+    """
+    for i in prange(t.shape[0]):
+        res = _dudleyCore(t[i],dRe[i],dH[i],supplyShockType[i],\
+                          loadShockType[i],n[i],nCyc[i],nTotal[i],\
+                          hardness[i],hTypeCode[i],d[i],z[i],fE[i],tC[i],\
+                          relativeMisalignment[i],h[i],phi[i],tW[i],f[i],\
+                          dOi[i],dRi[i],reversible[i],toothEndCode[i],\
+                          flexible[i],y[i])
+        for j in range(len(res)):
+            out[i,j] = res[j]
+        #end for
+    #end for
+#end def
 
 class DudleyMethodSpline(object):
     """Calculator of the spline and hub durability based upon the procedure \
@@ -56,7 +637,7 @@ class DudleyMethodSpline(object):
     :type nTotal: int
     :type reversible: boolean
     :type hardness: float
-    :type hType: str
+    :type hType: str or HType
     :type d: float
     :type z: int
     :type fE: float
@@ -69,10 +650,59 @@ class DudleyMethodSpline(object):
     :type dRi: float
     :type autoCalc: boolean
     :type y: float
-    :type toothEnd: str
+    :type toothEnd: str or ToothEnd
     
     """
     
+    #Inputs followed by the calculated values
+    __slots__ = ('_t',\
+                 '_dRe',\
+                 '_supplyShockType',\
+                 '_loadShockType',\
+                 '_n',\
+                 '_nCyc',\
+                 '_nTotal',\
+                 '_hardness',\
+                 '_d',\
+                 '_z',\
+                 '_fE',\
+                 '_tC',\
+                 '_relativeMisalignment',\
+                 '_h',\
+                 '_phi',\
+                 '_tW',\
+                 '_f',\
+                 '_dOi',\
+                 '_dRi',\
+                 '_dH',\
+                 '_hType',\
+                 '_reversible',\
+                 '_toothEnd',\
+                 '_flexible',\
+                 '_y',\
+                 '_calcInputs',\
+                 '_shaftStress',\
+                 '_appFactor',\
+                 '_splineLF',\
+                 '_allowShaftStress',\
+                 '_maxShaftStress',\
+                 '_shaftSafetyFactor',\
+                 '_teethLoadkM',\
+                 '_teethShearStress',\
+                 '_maxTeethShearStress',\
+                 '_teethSafetyFactor',\
+                 '_compStress',\
+                 '_allowCompStress',\
+                 '_lifeWear',\
+                 '_factoredCompStress',\
+                 '_compSafetyFactor',\
+                 '_burstRad',\
+                 '_burstCentrifugal',\
+                 '_burstTens',\
+                 '_burstTotal',\
+                 '_allowBurstStress',\
+                 '_burstSafetyFactor')
+    
     def __init__(self,\
                  t,\
                  dRe,\
@@ -128,101 +758,266 @@ class DudleyMethodSpline(object):
         self._toothEnd = toothEnd
         self._flexible = flexible
         self._y = y
+        self._calcInputs = None
         if autoCalc:
             self.calculate()
+        else:
+            #Check the discrete inputs now, calculate() checks them on use
+            _checkTableRanges(hardness,_hardnessTypeCode(hType),nTotal,\
+                              flexible)
+            _toothEndCode(toothEnd)
+            _checkShockTypes(supplyShockType,loadShockType)
         #end if
     #end def
     
     def calculate(self):
         """Based on the stored variables calculate the Dudley method
         
+        The results are only recalculated when the inputs have changed since
+        the last call, so repeated calls, e.g. from :meth:`__repr__`, are
+        cheap
+        
         """
-        self._shaftStress = self.solidShaftStress(self._t,self._dRe) \
-            if self._dH == 0.0 else self.hollowShaftStress(self._t,\
-                                                           self._dRe,\
-                                                           self._dH)
-        self._appFactor = \
-            self.getSplineApplicationFactor(self._supplyShockType,\
-                                            self._loadShockType)
-        self._splineLF = self.getLifeFactor(self._nCyc,\
-                                            reversible=self._reversible)
-        self._allowShaftStress = \
-            self.getAllowableShearStressByHardness(self._hardness,\
-                                                   hType=self._hType)
-        self._maxShaftStress = self.maximumShaftStress(self._shaftStress,\
-                                                       self._appFactor,\
-                                                       self._splineLF)
-        self._shaftSafetyFactor = \
-            self.getShaftSafetyFactor(self._maxShaftStress,\
-                    self._allowShaftStress)
-        self._teethLoadkM = \
-            self.getLoadDistributionFactorSpline(self._relativeMisalignment,\
-                                                 self._fE)
-        self._teethShearStress = self.getTeethShearStress(self._t,\
-                                                          self._teethLoadkM,\
-                                                          self._d,\
-                                                          self._z,\
-                                                          self._fE,\
-                                                          self._tC)
-        self._maxTeethShearStress = \
-            self.maximumShaftStress(self._teethShearStress,\
-                                 self._appFactor,\
-                                 self._splineLF)
-        self._teethSafetyFactor = \
-            self.getShaftSafetyFactor(self._maxTeethShearStress,\
-                                      self._allowShaftStress)
-        self._compStress = self.getCompressiveStress(self._t,\
-                                                     self._teethLoadkM,\
-                                                     self._d,\
-                                                     self._z,\
-                                                     self._fE,\
-                                                     self._h)
-        self._allowCompStress = \
-            self.getAllowableCompressiveStressForSplines(self._hardness,\
-                                                 self._hType,\
-                                                 toothEnd=self._toothEnd)
+        inputs = (self._t,\
+                  self._dRe,\
+                  self._dH,\
+                  self._supplyShockType,\
+                  self._loadShockType,\
+                  self._n,\
+                  self._nCyc,\
+                  self._nTotal,\
+                  self._hardness,\
+                  self._hType,\
+                  self._d,\
+                  self._z,\
+                  self._fE,\
+                  self._tC,\
+                  self._relativeMisalignment,\
+                  self._h,\
+                  self._phi,\
+                  self._tW,\
+                  self._f,\
+                  self._dOi,\
+                  self._dRi,\
+                  self._reversible,\
+                  self._toothEnd,\
+                  self._flexible,\
+                  self._y)
+        if inputs == self._calcInputs:
+            return
+        #end if
+        try:
+            results = _dudleyCompute(*inputs)
+        except TypeError:
+            #0-d array inputs are unhashable, use their scalars as the key
+            inputs = _unwrapScalars(inputs)
+            results = _dudleyCompute(*inputs)
+        #end try
+        (self._shaftStress,\
+         self._appFactor,\
+         self._splineLF,\
+         self._allowShaftStress,\
+         self._maxShaftStress,\
+         self._shaftSafetyFactor,\
+         self._teethLoadkM,\
+         self._teethShearStress,\
+         self._maxTeethShearStress,\
+         self._teethSafetyFactor,\
+         self._compStress,\
+         self._allowCompStress,\
+         lifeWear,\
+         self._factoredCompStress,\
+         self._compSafetyFactor,\
+         self._burstRad,\
+         self._burstCentrifugal,\
+         self._burstTens,\
+         self._burstTotal,\
+         self._allowBurstStress,\
+         self._burstSafetyFactor) = results
         if self._flexible:
-            self._lifeWear = self.getSplineWearLifeFactor(self._nTotal)
-            self._factoredCompStress = \
-                self.getAllowableCompressiveStress(self._compStress,\
-                                                   self._appFactor,\
-                                                   self._lifeWear)
-        else:
-            self._factoredCompStress = \
-                self.getAllowableCompressiveStress(self._compStress,\
-                                                   self._appFactor,\
-                                                   self._splineLF,\
-                                                   flexible=False)
+            self._lifeWear = lifeWear
+        #end if
+        self._calcInputs = inputs
+    #end def
+    
+    @classmethod
+    def calculateBatch(cls,arrays):
+        """Calculate the Dudley method for many splines at once
+        
+        Each input is held as an array, one entry per spline, and every
+        stage of :meth:`calculate` is evaluated in vectorised form, so a
+        sweep of designs costs a single pass rather than one object each
+        
+        :param arrays: Inputs keyed by the constructor argument names, with \
+        the optional arguments taking the constructor defaults if omitted. \
+        The inputs are broadcast together, so scalars are shared and, e.g., \
+        a column of torques against a row of root diameters sweeps the \
+        whole grid. Hardness types and tooth ends may be given as names or \
+        codes. A pandas DataFrame with a column per input may be given in \
+        place of a dict.
+        :type arrays: dict or pandas.DataFrame
+        
+        :returns: Returns the calculated values keyed by the attribute names \
+        used in :meth:`calculate` without the leading underscore, e.g. \
+        ``'shaftSafetyFactor'``. ``'lifeWear'`` is NaN for rigid splines. \
+        A DataFrame input gives a DataFrame of results on the same index.
+        :rtype: dict or pandas.DataFrame
+        
+        """
+        inp = _batchInputs(arrays)
+        t = inp['t'].astype(float)
+        dRe = inp['dRe'].astype(float)
+        dH = inp['dH'].astype(float)
+        hardness = inp['hardness']
+        d = inp['d']
+        z = inp['z']
+        fE = inp['fE']
+        hType = inp['hType']
+        toothEnd = inp['toothEnd']
+        rockwell = hType == HType.ROCKWELL_C
+        reversible = inp['reversible'].astype(int)
+        flexible = inp['flexible'].astype(bool)
+        
+        def hardnessBucket(limits):
+            """Bucket the hardnesses against the limits of a stress table
+            
+            """
+            return np.searchsorted(limits,hardness,side='right')
+        #end def
+        
+        #The Brinell limits are shared by the shear, compressive and
+        #bursting tables so bucket once
+        brinellBucket = None if rockwell.all() \
+            else hardnessBucket(_BRINELL_LIMITS)
+        res = {}
+        res['shaftStress'] = _select(dH == 0.0,\
+                            lambda: _solidShaftStressV(t,dRe),\
+                            lambda: _hollowShaftStressV(t,dRe,dH))
+        res['appFactor'] = kA = \
+            _APPLICATION_FACTORS[inp['supplyShockType'],\
+                                 inp['loadShockType']]
+        res['splineLF'] = lF = \
+            _LIFE_FACTORS[reversible,\
+                          np.searchsorted(_LIFE_CYCLES,inp['nCyc'],\
+                                          side='right')]
+        res['allowShaftStress'] = _select(rockwell,\
+            lambda: _SHEAR_ROCKWELL[hardnessBucket(_SHEAR_ROCKWELL_LIMITS)],\
+            lambda: _SHEAR_BRINELL[brinellBucket])
+        stressMultiplier = kA/lF
+        res['maxShaftStress'] = res['shaftStress']*stressMultiplier
+        res['shaftSafetyFactor'] = \
+            res['allowShaftStress']/res['maxShaftStress']
+        res['teethLoadkM'] = kM = _KM_TABLE[\
+            np.minimum(np.searchsorted(_KM_MISALIGNMENT,\
+                                       inp['relativeMisalignment'],\
+                                       side='right'),3),\
+            np.minimum(np.searchsorted(_KM_FACE_WIDTH,fE,side='right'),3)]
+        toothLoad = t*kM/(d*z*fE)
+        res['teethShearStress'] = 4.*toothLoad/inp['tC']
+        res['maxTeethShearStress'] = res['teethShearStress']*stressMultiplier
+        res['teethSafetyFactor'] = \
+            res['allowShaftStress']/res['maxTeethShearStress']
+        res['compStress'] = 2.*toothLoad/inp['h']
+        res['allowCompStress'] = _COMP_STRESS[hType,\
+            toothEnd,\
+            _select(rockwell,\
+                    lambda: hardnessBucket(_COMP_LIMITS[1]),\
+                    lambda: brinellBucket)]
+        res['lifeWear'] = _select(flexible,\
+            lambda: _WEAR_FACTORS[np.searchsorted(_WEAR_REVS,inp['nTotal'],\
+                                                  side='right')],\
+            lambda: np.full(flexible.shape,np.nan))
+        res['factoredCompStress'] = _select(flexible,\
+                            lambda: res['compStress']*kA/res['lifeWear'],\
+                            lambda: res['compStress']*kA/(9.*lF))
+        res['compSafetyFactor'] = \
+            res['allowCompStress']/res['factoredCompStress']
+        res['burstRad'] = t*np.tan(inp['phi'])/\
+            (math.pi*d*inp['tW']*inp['f'])
+        n = inp['n'].astype(float)
+        dOiInch = inp['dOi']*_M_TO_INCH
+        dRiInch = inp['dRi']*_M_TO_INCH
+        res['burstCentrifugal'] = _PSI_TO_PA*0.828e-6*n*n*\
+            (2.*dOiInch*dOiInch+0.424*dRiInch*dRiInch)
+        res['burstTens'] = (4.*t)/(d*d*fE*inp['y'])
+        res['burstTotal'] = kA*kM*(res['burstRad']+res['burstTens'])+\
+            res['burstCentrifugal']
+        res['allowBurstStress'] = _select(rockwell,\
+            lambda: _BURST_ROCKWELL[hardnessBucket(_BURST_ROCKWELL_LIMITS)],\
+            lambda: _BURST_BRINELL[brinellBucket])
+        res['burstSafetyFactor'] = \
+            res['allowBurstStress']*lF/res['burstTotal']
+        if hasattr(arrays,'columns'):
+            return type(arrays)(res,index=arrays.index)
         #end if
-        self._compSafetyFactor = self._allowCompStress/self._factoredCompStress
-        self._burstRad = self.getBurstingRadialStress(self._t,\
-                                                      self._phi,\
-                                                      self._d,\
-                                                      self._tW,\
-                                                      self._f)
-        self._burstCentrifugal = \
-            self.getBurstingCentrifugalStress(self._n,\
-                                              self._dOi,\
-                                              self._dRi)
-        self._burstTens = self.getBurstingTensileStress(self._t,\
-                                                        self._d,\
-                                                        self._fE,\
-                                                        y=self._y)
-        self._burstTotal = self.getTotalBurstingStress(self._appFactor,\
-                                                       self._teethLoadkM,\
-                                                       self._burstRad,\
-                                                       self._burstCentrifugal,\
-                                                       self._burstTens)
-        self._allowBurstStress = \
-            self.getAllowableBurstingStressByHardness(self._hardness,\
-                                                      hType=self._hType)
-        self._burstSafetyFactor = \
-            self.getBurstingSafetyFactor(self._burstTotal,\
-                                         self._allowBurstStress,\
-                                         self._splineLF)
+        return res
     #end def
     
-    def solidShaftStress(self,t,dRE):
+    @classmethod
+    def evaluateBatch(cls,arrays):
+        """Calculate the Dudley method for many splines at once, one spline \
+        per core at a time
+        
+        Takes and returns the same as :meth:`calculateBatch`, but runs the
+        compiled single spline calculation over the samples in parallel
+        rather than vectorising each stage. This suits large Monte-Carlo
+        samples when numba is installed, without numba it is a plain loop.
+        
+        :param arrays: Inputs keyed by the constructor argument names
+        :type arrays: dict or pandas.DataFrame
+        
+        :returns: Returns the calculated values keyed by the attribute names \
+        used in :meth:`calculate` without the leading underscore
+        :rtype: dict or pandas.DataFrame
+        
+        """
+        inp = _batchInputs(arrays)
+        shape = inp['t'].shape
+        
+        def flat(key,dtype=float):
+            """Flatten an input to the contiguous 1-D array of the kernel
+            
+            """
+            return np.ascontiguousarray(inp[key],dtype=dtype).reshape(-1)
+        #end def
+        
+        out = np.empty((int(np.prod(shape)),len(_DudleyResult._fields)))
+        _dudleyBatch(flat('t'),\
+                     flat('dRe'),\
+                     flat('dH'),\
+                     flat('supplyShockType',np.int64),\
+                     flat('loadShockType',np.int64),\
+                     flat('n'),\
+                     flat('nCyc'),\
+                     flat('nTotal'),\
+                     flat('hardness'),\
+                     flat('hType',np.int64),\
+                     flat('d'),\
+                     flat('z'),\
+                     flat('fE'),\
+                     flat('tC'),\
+                     flat('relativeMisalignment'),\
+                     flat('h'),\
+                     flat('phi'),\
+                     flat('tW'),\
+                     flat('f'),\
+                     flat('dOi'),\
+                     flat('dRi'),\
+                     flat('reversible',np.bool_),\
+                     flat('toothEnd',np.int64),\
+                     flat('flexible',np.bool_),\
+                     flat('y'),\
+                     out)
+        res = dict((k,out[:,j].reshape(shape)) \
+                   for j,k in enumerate(_DudleyResult._fields))
+        if hasattr(arrays,'columns'):
+            return type(arrays)(res,index=arrays.index)
+        #end if
+        return res
+    #end def
+    
+    @staticmethod
+    def solidShaftStress(t,dRE):
         """Calculate the shaft stress for a solid shaft, :math:`S_s`
         
         :param t: Shaft torque, :math:`T` [:math:`Nm`]
@@ -235,10 +1030,14 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        return 16.*t/(np.pi*dRE**3.)
+        if np.ndim(t) or np.ndim(dRE):
+            return _solidShaftStressV(t,dRE)
+        #end if
+        return _16_OVER_PI*t/(dRE*dRE*dRE)
     #end def
     
-    def hollowShaftStress(self,t,dRE,dH):
+    @staticmethod
+    def hollowShaftStress(t,dRE,dH):
         """Calculate the shaft stress for a hollow shaft, :math:`S_s`
         
         :param t: Shaft torque, :math:`T` [:math:`Nm`]
@@ -252,10 +1051,16 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        return 16.*t*dRE/(np.pi*(dRE**4.-dH**4.))
+        if np.ndim(t) or np.ndim(dRE) or np.ndim(dH):
+            return _hollowShaftStressV(t,dRE,dH)
+        #end if
+        dRE2 = dRE*dRE
+        dH2 = dH*dH
+        return _16_OVER_PI*t*dRE/(dRE2*dRE2-dH2*dH2)
     #end def
     
-    def getSplineApplicationFactor(self,supplyShockType,loadShockType):
+    @staticmethod
+    def getSplineApplicationFactor(supplyShockType,loadShockType):
         """Get the spline application factor, :math:`K_a` based on look up \
         table
         
@@ -318,12 +1123,14 @@ class DudleyMethodSpline(object):
         :returns: Returns the spline application factor, :math:`K_a` []
         :rtype: float
         """
-        
-        kTable = [[1.,1.2,1.5,1.8],[1.2,1.3,1.8,2.1],[2.,2.2,2.4,2.8]]
-        return kTable[supplyShockType][loadShockType]
+        if _isArray(supplyShockType,loadShockType):
+            return _APPLICATION_FACTORS[supplyShockType,loadShockType]
+        #end if
+        return _applicationFactor(supplyShockType,loadShockType)
     #end def
     
-    def getLifeFactor(self,nCyc,reversible=False):
+    @staticmethod
+    def getLifeFactor(nCyc,reversible=False):
         """Get the life factor, :math:`L_f` based on look up table
         
         +-------------------------+-------------------------------------+
@@ -352,21 +1159,16 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        
-        if nCyc < 1000:
-            return 1.8 if reversible else 1.8
-        elif nCyc < 10000:
-            return 1.0 if reversible else 1.0
-        elif nCyc < 100000:
-            return 0.4 if reversible else 0.5
-        elif nCyc < 1000000:
-            return 0.3 if reversible else 0.4
-        else:
-            return 0.2 if reversible else 0.3
+        if _isArray(nCyc):
+            return _LIFE_FACTORS[int(reversible),\
+                                 np.searchsorted(_LIFE_CYCLES,nCyc,\
+                                                 side='right')]
         #end if
+        return _lifeFactor(nCyc,reversible)
     #end def
     
-    def maximumShaftStress(self,sS,kA,lF):
+    @staticmethod
+    def maximumShaftStress(sS,kA,lF):
         """Get the maximum shaft stress, :math:`{S_s}^\prime`
         
         :param sS: Calculated Shaft stress, :math:`S_s` [:math:`N/m^2`]
@@ -385,7 +1187,8 @@ class DudleyMethodSpline(object):
         return sS*kA/lF
     #end def
     
-    def getAllowableShearStressByHardness(self,hardness,hType='Brinell'):
+    @staticmethod
+    def getAllowableShearStressByHardness(hardness,hType='Brinell'):
         """Get the maximum allowable shear stress for a spline based upon the \
         the surface hardness of the component, :math:`{{S_s}^\prime}_{max}`
         
@@ -393,7 +1196,7 @@ class DudleyMethodSpline(object):
         :param hType: The type of hardness measurement used
         
         :type hardness: float
-        :type hType: str
+        :type hType: str or HType
         
         :returns: Returns the maximum allowable shear stress, \
         :math:`{{S_s}^\prime}_{max}` [:math:`N/{m^2}]
@@ -426,30 +1229,14 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        pc = PressureConverter()
-        if hType == 'Brinell':
-            if hardness < 200.:
-                return pc.psiToPa(20000)
-            elif hardness < 260.:
-                return pc.psiToPa(30000)
-            elif hardness < 351.:
-                return pc.psiToPa(40000)
-            #end if
-        elif hType == 'Rockwell C':
-            if hardness < 38.:
-                return pc.psiToPa(40000)
-            elif hardness < 46.:
-                return pc.psiToPa(45000)
-            elif hardness < 53:
-                return pc.psiToPa(40000)
-            elif hardness < 63:
-                return pc.psiToPa(50000)
-        else:
-            raise UnrecognisedHardnessTypeException()
+        if _isArray(hardness):
+            return _allowableShearStress.__wrapped__(hardness,hType)
         #end if
+        return _allowableShearStress(hardness,hType)
     #end def
     
-    def getShaftSafetyFactor(self,maxShaftStress,allowableShaftStress):
+    @staticmethod
+    def getShaftSafetyFactor(maxShaftStress,allowableShaftStress):
         """Get the shaft safety factor, :math:`f_{safe}` based on the \
         calculated maximum shaft stress and maximum allowable shaft stress
         
@@ -469,7 +1256,8 @@ class DudleyMethodSpline(object):
         return allowableShaftStress/maxShaftStress
     #end def
     
-    def getTeethShearStress(self,t,kM,d,z,fE,tC):
+    @staticmethod
+    def getTeethShearStress(t,kM,d,z,fE,tC):
         """Get the teeth shear stress, :math:`S_{s,j}`
         
         :param t: Torque, :math:`T` [:math:`Nm`]
@@ -494,7 +1282,8 @@ class DudleyMethodSpline(object):
         return (4.*t*kM)/(d*z*fE*tC)
     #end def
     
-    def getLoadDistributionFactorSpline(self,relativeMisalignment,fE):
+    @staticmethod
+    def getLoadDistributionFactorSpline(relativeMisalignment,fE):
         """Get the load distribution factor, :math:`K_m` based on the relative \
         misalignment and face width
         
@@ -526,31 +1315,15 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        
-        lookUp = [[1.,1.,1.,1.5],[1.,1.,1.5,2.],[1.,1.5,2.,2.5],[1.5,2.,2.5,3.]]
-        
-        m = 0
-        for i in [0.001,0.002,0.004,0.008]:
-            if relativeMisalignment < i:
-                break
-            else:
-                m += 1
-            #end if
-        #end for
-        m = 3 if m > 3 else m
-        n = 0
-        for i in [12.7e-3,25.4e-3,50.8e-3,101.e-3]:
-            if fE < i:
-                break
-            else:
-                n += 1
-            #end if
-        #end for
-        n = 3 if n > 3 else n
-        return lookUp[m][n]
+        m = np.minimum(np.searchsorted(_KM_MISALIGNMENT,\
+                                       relativeMisalignment,\
+                                       side='right'),3)
+        n = np.minimum(np.searchsorted(_KM_FACE_WIDTH,fE,side='right'),3)
+        return _KM_TABLE[m,n]
     #end def
     
-    def getCompressiveStress(self,t,kM,d,z,fE,h):
+    @staticmethod
+    def getCompressiveStress(t,kM,d,z,fE,h):
         """Get the compressive stress, :math:`\sigma_c`, acting on the spline \
         teeth
         
@@ -576,8 +1349,8 @@ class DudleyMethodSpline(object):
         return (2.*t*kM)/(d*z*fE*h)
     #end def
     
-    def getAllowableCompressiveStressForSplines(self,\
-                                                hardness,\
+    @staticmethod
+    def getAllowableCompressiveStressForSplines(hardness,\
                                                 hType='Brinell',
                                                 toothEnd='Straight'):
         """Get the allowable compressive stress for the splines, \
@@ -588,8 +1361,8 @@ class DudleyMethodSpline(object):
         :param toothEnd: Design of the tooth end, Straight or Crowned
         
         :type hardness: float
-        :type hType: str
-        :type toothEnd: str
+        :type hType: str or HType
+        :type toothEnd: str or ToothEnd
         
         Looked up from the following table
         
@@ -616,56 +1389,16 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        pc = PressureConverter()
-        if toothEnd not in ['Straight','Crowned']:
-            raise UnrecognisedToothEndException()
-        #end if
-        if hType == 'Brinell':
-            if hardness < 200:
-                if toothEnd == 'Straight':
-                    return pc.psiToPa(1500)
-                else:
-                    return pc.psiToPa(6000)
-                #end if
-            elif hardness < 260:
-                if toothEnd == 'Straight':
-                    return pc.psiToPa(2000)
-                else:
-                    return pc.psiToPa(8000)
-                #end if
-            elif hardness < 351:
-                if toothEnd == 'Straight':
-                    return pc.psiToPa(3000)
-                else:
-                    return pc.psiToPa(12000)
-                #end if
-            #end if
-        elif hType == 'Rockwell C':
-            if hardness < 38:
-                if toothEnd == 'Straight':
-                    return pc.psiToPa(3000)
-                else:
-                    return pc.psiToPa(12000)
-                #end if
-            elif hardness < 53:
-                if toothEnd == 'Straight':
-                    return pc.psiToPa(4000)
-                else:
-                    return pc.psiToPa(16000)
-                #end if
-            elif hardness < 63:
-                if toothEnd == 'Straight':
-                    return pc.psiToPa(5000)
-                else:
-                    return pc.psiToPa(20000)
-                #end if
-            #end if
-        else:
-            raise UnrecognisedHardnessTypeException()
+        if _isArray(hardness):
+            return _allowableCompressiveStress.__wrapped__(hardness,\
+                                                           hType,\
+                                                           toothEnd)
         #end if
+        return _allowableCompressiveStress(hardness,hType,toothEnd)
     #end def
     
-    def getSplineWearLifeFactor(self,nCyc):
+    @staticmethod
+    def getSplineWearLifeFactor(nCyc):
         """Get the spline wear factor, :math:`L_w`
         
         :param nCyc: Number of cycles, :math:`n` []
@@ -696,25 +1429,15 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        
-        if nCyc < 1e4:
-            return 4.0
-        elif nCyc < 1e5:
-            return 2.8
-        elif nCyc < 1e6:
-            return 2.
-        elif nCyc < 1e7:
-            return 1.4
-        elif nCyc < 1e8:
-            return 1.
-        elif nCyc < 1e9:
-            return 0.7
-        elif nCyc < 1e10:
-            return 0.5
+        if _isArray(nCyc):
+            return _WEAR_FACTORS[np.searchsorted(_WEAR_REVS,nCyc,\
+                                                 side='right')]
         #end if
+        return _wearLifeFactor(nCyc)
     #end def
     
-    def getAllowableCompressiveStress(self,sC,kA,lW,flexible=True):
+    @staticmethod
+    def getAllowableCompressiveStress(sC,kA,lW,flexible=True):
         """Get the allowable compressive stress, :math:`{S^{\prime}}_c`
         
         :param sC: Maximum compressive stress, :math:`S_c` [:math:`N/mm^2`]
@@ -726,21 +1449,24 @@ class DudleyMethodSpline(object):
         :type sC: float
         :type kA: float
         :type lW: float
-        :type flexible: boolean
+        :type flexible: boolean or numpy.ndarray
         
         :returns: Returns the allowable compressive stress, \
         :math:`{S^{\prime}}_c` [:math:`N/mm^2`]
         :rtype: float
         
         """
-        if flexible:
+        if np.ndim(flexible):
+            return sC*kA/np.where(flexible,lW,9.*lW)
+        elif flexible:
             return sC*kA/lW
         else:
             return sC*kA/(9.*lW)
         #end if
     #end def
     
-    def getBurstingRadialStress(self,t,phi,d,tW,f):
+    @staticmethod
+    def getBurstingRadialStress(t,phi,d,tW,f):
         """Get the bursting stress due to radial stress, :math:`S_1`
         
         :param t: Torque, :math:`T` [:math:`Nm`]
@@ -760,10 +1486,12 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        return t*np.tan(phi)/(np.pi*d*tW*f)
+        trig = np if np.ndim(phi) else math
+        return t*trig.tan(phi)/(math.pi*d*tW*f)
     #end def
     
-    def getBurstingCentrifugalStress(self,n,dOi,dRi):
+    @staticmethod
+    def getBurstingCentrifugalStress(n,dOi,dRi):
         """Get the bursting stress to the centrifugal stress, :math:`S_2`
         
         :param n: Rotational speed, :math:`n` [:math:`rpm`]
@@ -781,13 +1509,15 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        lc = LengthConverter()
-        pc = PressureConverter()
-        return pc.psiToPa(0.828*1.0e-6*float(n)**2.*\
-                ((2.*lc.mToInch(dOi)**2.+(0.424*lc.mToInch(dRi)**2.))))
+        n = np.asarray(n,dtype=float)
+        dOiInch = dOi*_M_TO_INCH
+        dRiInch = dRi*_M_TO_INCH
+        return _PSI_TO_PA*0.828e-6*n*n*\
+                (2.*dOiInch*dOiInch+0.424*dRiInch*dRiInch)
     #end def
     
-    def getBurstingTensileStress(self,t,d,fE,y=1.5):
+    @staticmethod
+    def getBurstingTensileStress(t,d,fE,y=1.5):
         """Get teh bursting stress due to the tensile stress, :math:`S_3`
         
         :param t: Torsion, :math:`T` [:math:`Nm`]
@@ -800,10 +1530,11 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        return (4.*t)/(d**2.*fE*y)
+        return (4.*t)/(d*d*fE*y)
     #end def
     
-    def getLewisFormFactor(self,phiNR,phiNL,hF,sF,k,kPsi=1.,cH=1.):
+    @staticmethod
+    def getLewisFormFactor(phiNR,phiNL,hF,sF,k,kPsi=1.,cH=1.):
         """Get the Lewis form factor, :math:`Y`, using the calulation from \
         Eqn. 5.78 from AGMA 908-B89
         
@@ -830,14 +1561,16 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        return kPsi/((np.cos(phiNL)/np.cos(phiNR))*((6.*hF/(sF**2.*cH))-\
-                      (np.tan(phiNL)/sF)))
+        trig = np if np.ndim(phiNL) or np.ndim(phiNR) else math
+        return kPsi/((trig.cos(phiNL)/trig.cos(phiNR))*((6.*hF/(sF*sF*cH))-\
+                      (trig.tan(phiNL)/sF)))
     #end def
     
 ### TODO: Add in functionality to calculate the parameters required for the 
     #Lewis form factor 
     
-    def getTotalBurstingStress(self,kA,kM,s1,s2,s3):
+    @staticmethod
+    def getTotalBurstingStress(kA,kM,s1,s2,s3):
         """Get the total bursting stress,:math:`S_t`, on a tooth in the spline \
         based on the combination of various bursting stresses
         
@@ -862,7 +1595,8 @@ class DudleyMethodSpline(object):
         return (kA*kM*(s1+s3))+s2
     #end def
     
-    def getAllowableBurstingStressByHardness(self,hardness,hType='Brinell'):
+    @staticmethod
+    def getAllowableBurstingStressByHardness(hardness,hType='Brinell'):
         """Get the maximum allowable bursting stress for a spline based upon \
         the surface hardness of the component, :math:`{{S_t}^\prime}_{max}`
         
@@ -870,7 +1604,7 @@ class DudleyMethodSpline(object):
         :param hType: The type of hardness measurement used
         
         :type hardness: float
-        :type hType: str
+        :type hType: str or HType
         
         
         Uses the following lookup table:
@@ -898,28 +1632,14 @@ class DudleyMethodSpline(object):
         :rtype: float
         
         """
-        pc = PressureConverter()
-        if hType == 'Brinell':
-            if hardness < 200.:
-                return pc.psiToPa(22000)
-            elif hardness < 260.:
-                return pc.psiToPa(32000)
-            elif hardness < 351.:
-                return pc.psiToPa(45000)
-            #end if
-        elif hType == 'Rockwell C':
-            if hardness < 46.:
-                return pc.psiToPa(45000)
-            elif hardness < 53:
-                return pc.psiToPa(50000)
-            elif hardness < 63:
-                return pc.psiToPa(55000)
-        else:
-            raise UnrecognisedHardnessTypeException()
+        if _isArray(hardness):
+            return _allowableBurstingStress.__wrapped__(hardness,hType)
         #end if
+        return _allowableBurstingStress(hardness,hType)
     #end def
     
-    def getBurstingSafetyFactor(self,sTTot,sTTotMax,lF):
+    @staticmethod
+    def getBurstingSafetyFactor(sTTot,sTTotMax,lF):
         """Get the bursting safety factor, :math:`F_{max,burst}`
         
         :param sTTot:Total bursting stress, \
@@ -948,53 +1668,44 @@ class DudleyMethodSpline(object):
         
         """
         self.calculate()
-        outStr = 'DudleyMethodSpline object\n\n'
-        outStr += 'Shaft Stress Calculations\n\n'
-        outStr += 'Shaft Stress: {0}MPa\n'.format(self._shaftStress/1.0e6)
-        outStr += 'Allowable Shear Stress: {0}MPa\n\n'.\
-            format(self._allowShaftStress/1.0e6)
-        outStr += 'Shaft Stress - adjusted for application and life'
-        outStr += ': {0}MPa\n'.format(self._maxShaftStress/1.0e6)
-        outStr += 'Shaft Safety Factor: {0}\n\n'.format(self._shaftSafetyFactor)
-        outStr += 'Teeth Shear Stress\n\n'
-        outStr += 'Teeth Shear Stress: {0}MPa\n'.\
-            format(self._teethShearStress/1.0e6)
-        outStr += 'Teeth Max Stress: {0}MPa\n'.\
-            format(self._maxTeethShearStress/1.0e6)
-        outStr += 'Teeth Safety Factor: {0}\n\n'.format(self._teethSafetyFactor)
-        outStr += 'Compressive Stress\n\n'
-        outStr += 'Compressive Stress: {0}MPa\n'.format(self._compStress/1.0e6)
-        outStr += 'Allowable Compressive Stress: {0}MPa\n'.\
-            format(self._allowCompStress/1.0e6)
-        outStr += 'Factored Compressive Stress: {0}MPa\n'.\
-            format(self._factoredCompStress/1.0e6)
-        outStr += 'Compressive Safety Factor: {0}\n\n'.\
-            format(self._compSafetyFactor)
-        outStr += 'Bursting Stress\n\n'
-        outStr += 'Bursting Stress - Radial: {0}\n'.format(self._burstRad/1.0e6)
-        outStr += 'Bursting Stress - Centrifugal: {0}\n'.\
-            format(self._burstCentrifugal/1.0e6)
-        outStr += 'Bursting Stress - Tensile: {0}\n'.\
-            format(self._burstTens/1.0e6)
-        outStr += 'Bursting Stress - Total: {0}\n'.\
-            format(self._burstTotal/1.0e6)
-        outStr += 'Allowable Bursting Stress: {0}MPa\n'.\
-            format(self._allowBurstStress/1.0e6)
-        outStr += 'Bursting Safety Factor: {0}'.format(self._burstSafetyFactor)
-        outStr += '\n\nFactors\n\n'
-        outStr += 'Spline Application Factor, Ka: {0}\n'.format(self._appFactor)
-        outStr += 'Fatigue Life Factor, Lf: {0}\n'.format(self._splineLF)
-        outStr += 'Load distibution Factor - Teeth: {0}\n'.\
-            format(self._teethLoadkM)
+        parts = ['DudleyMethodSpline object\n\n',\
+                 'Shaft Stress Calculations\n\n',\
+                 f'Shaft Stress: {self._shaftStress/1.0e6}MPa\n',\
+                 'Allowable Shear Stress: '\
+                 f'{self._allowShaftStress/1.0e6}MPa\n\n',\
+                 'Shaft Stress - adjusted for application and life: '\
+                 f'{self._maxShaftStress/1.0e6}MPa\n',\
+                 f'Shaft Safety Factor: {self._shaftSafetyFactor}\n\n',\
+                 'Teeth Shear Stress\n\n',\
+                 f'Teeth Shear Stress: {self._teethShearStress/1.0e6}MPa\n',\
+                 f'Teeth Max Stress: {self._maxTeethShearStress/1.0e6}MPa\n',\
+                 f'Teeth Safety Factor: {self._teethSafetyFactor}\n\n',\
+                 'Compressive Stress\n\n',\
+                 f'Compressive Stress: {self._compStress/1.0e6}MPa\n',\
+                 'Allowable Compressive Stress: '\
+                 f'{self._allowCompStress/1.0e6}MPa\n',\
+                 'Factored Compressive Stress: '\
+                 f'{self._factoredCompStress/1.0e6}MPa\n',\
+                 f'Compressive Safety Factor: {self._compSafetyFactor}\n\n',\
+                 'Bursting Stress\n\n',\
+                 f'Bursting Stress - Radial: {self._burstRad/1.0e6}\n',\
+                 'Bursting Stress - Centrifugal: '\
+                 f'{self._burstCentrifugal/1.0e6}\n',\
+                 f'Bursting Stress - Tensile: {self._burstTens/1.0e6}\n',\
+                 f'Bursting Stress - Total: {self._burstTotal/1.0e6}\n',\
+                 'Allowable Bursting Stress: '\
+                 f'{self._allowBurstStress/1.0e6}MPa\n',\
+                 f'Bursting Safety Factor: {self._burstSafetyFactor}',\
+                 '\n\nFactors\n\n',\
+                 f'Spline Application Factor, Ka: {self._appFactor}\n',\
+                 f'Fatigue Life Factor, Lf: {self._splineLF}\n',\
+                 f'Load distibution Factor - Teeth: {self._teethLoadkM}\n']
         try:
-            outStr += 'Flexible Life Factor, Lw: {0}\n'.\
-                format(self._lifeWear)
+            parts.append(f'Flexible Life Factor, Lw: {self._lifeWear}\n')
         except AttributeError:
             pass
-        #end if
-        
-        
-        return outStr
+        #end try
+        return ''.join(parts)
     #end def
     
     def __str__(self):
@@ -1024,6 +1735,22 @@ class DudleyMethodSpline(object):
                              places=4)
     #end def
     
+    def test_ShaftStressArrays(self):
+        """Test the shaft stress calculations over arrays of inputs
+        
+        """
+        t = np.array([2.,5.,7.])
+        solid = self.solidShaftStress(t,3.)
+        hollow = self.hollowShaftStress(t,3.,2.)
+        for i in range(len(t)):
+            assert_almost_equals(solid[i],self.solidShaftStress(t[i],3.),\
+                                 places=12)
+            assert_almost_equals(hollow[i],\
+                                 self.hollowShaftStress(t[i],3.,2.),\
+                                 places=12)
+        #end for
+    #end def
+    
     def test_SplineApplicationFactor(self):
         """Test the selection of the application factor
         
@@ -1035,6 +1762,9 @@ class DudleyMethodSpline(object):
         assert_equals(self.getSplineApplicationFactor(0,2),1.5)
         assert_equals(self.getSplineApplicationFactor(0,3),1.8)
         assert_equals(self.getSplineApplicationFactor(2,3),2.8)
+        assert_equals(list(self.getSplineApplicationFactor(\
+                                        np.array([0,1,2]),np.array([1,0,3]))),\
+                      [1.2,1.2,2.8])
     #end def
     
     def test_LifeFactor(self):
@@ -1045,6 +1775,8 @@ class DudleyMethodSpline(object):
         assert_equals(self.getLifeFactor(1,reversible=True),1.8)
         assert_equals(self.getLifeFactor(9999,reversible=True),1.0)
         assert_equals(self.getLifeFactor(10001,reversible=True),0.4)
+        assert_equals(list(self.getLifeFactor(np.array([1,9999,1.0e7]))),\
+                      [1.8,1.0,0.3])
     #end def
     
     def test_MaxShaftStress(self):
@@ -1085,6 +1817,80 @@ class DudleyMethodSpline(object):
             3.44738,places=4)
     #end def
     
+    def test_HardnessTypeCodes(self):
+        """Check that the look ups accept the hardness and tooth end codes
+        
+        """
+        assert_equals(self.getAllowableShearStressByHardness(44.,\
+                                                hType=HType.ROCKWELL_C),\
+                      self.getAllowableShearStressByHardness(44.,\
+                                                hType='Rockwell C'))
+        assert_equals(self.getAllowableCompressiveStressForSplines(240.,\
+                                                hType=HType.BRINELL,\
+                                                toothEnd=ToothEnd.CROWNED),\
+                      self.getAllowableCompressiveStressForSplines(240.,\
+                                                hType='Brinell',\
+                                                toothEnd='Crowned'))
+    #end def
+    
+    def test_ZeroDimensionalLookUps(self):
+        """Check that the look ups accept 0-d arrays as well as scalars
+        
+        """
+        assert_equals(self.getSplineApplicationFactor(np.array(2),\
+                                                      np.array(3)),2.8)
+        assert_equals(self.getLifeFactor(np.array(9999.),reversible=True),1.0)
+        assert_equals(self.getSplineWearLifeFactor(np.array(5.0e4)),2.8)
+        assert_equals(self.getAllowableShearStressByHardness(np.array(180.),\
+                                                        hType='Brinell'),\
+                      self.getAllowableShearStressByHardness(180.,\
+                                                        hType='Brinell'))
+        assert_equals(self.getAllowableCompressiveStressForSplines(\
+                                                np.array(60.),\
+                                                hType='Rockwell C',\
+                                                toothEnd='Crowned'),\
+                      self.getAllowableCompressiveStressForSplines(60.,\
+                                                hType='Rockwell C',\
+                                                toothEnd='Crowned'))
+        assert_equals(self.getAllowableBurstingStressByHardness(\
+                                                np.array(240.),'Brinell'),\
+                      self.getAllowableBurstingStressByHardness(240.,\
+                                                                'Brinell'))
+    #end def
+    
+    def test_UnrecognisedInputs(self):
+        """Check that unknown hardness types, tooth ends and shock types, and \
+        out of table hardnesses and lives, are rejected on construction, with \
+        or without the calculation
+        
+        """
+        zeros = [0]*19
+        for args,kwargs,exception in \
+                [[zeros,{'hType':'Vickers'},\
+                  UnrecognisedHardnessTypeException],\
+                 [zeros,{'toothEnd':'Tapered'},\
+                  UnrecognisedToothEndException],\
+                 [[0,0,3]+zeros[3:],{},UnrecognisedShockTypeException],\
+                 [[0,0,0,7]+zeros[4:],{},UnrecognisedShockTypeException],\
+                 [[0,0,0,-1]+zeros[4:],{},UnrecognisedShockTypeException],\
+                 [zeros[:7]+[351.]+zeros[8:],{'hType':'Brinell'},\
+                  HardnessOutOfRangeException],\
+                 [zeros[:7]+[63.]+zeros[8:],{'hType':'Rockwell C'},\
+                  HardnessOutOfRangeException],\
+                 [zeros[:6]+[1.0e10]+zeros[7:],{'flexible':True},\
+                  WearLifeOutOfRangeException]]:
+            for autoCalc in [False,True]:
+                try:
+                    DudleyMethodSpline(*args,autoCalc=autoCalc,**kwargs)
+                except exception:
+                    pass
+                else:
+                    raise AssertionError('{0} not raised'.format(exception))
+                #end try
+            #end for
+        #end for
+    #end def
+    
     def test_ShaftSafetyFactor(self):
         """Check the shaft safety factor calculation
         
@@ -1114,6 +1920,11 @@ class DudleyMethodSpline(object):
                               fE[j]),lookUp[i][j])
             #end for
         #end for
+        assert_equals(self.getLoadDistributionFactorSpline(0.002,50.8e-3),2.5)
+        assert_equals(self.getLoadDistributionFactorSpline(0.01,0.2),3.)
+        assert_equals(list(self.getLoadDistributionFactorSpline(\
+                                        np.array(relMis),np.array(fE))),\
+                      [lookUp[i][i] for i in range(len(relMis))])
     #end def
     
     def test_CompressiveStress(self):
@@ -1169,6 +1980,9 @@ class DudleyMethodSpline(object):
         for t in testList:
             assert_equals(self.getSplineWearLifeFactor(t[0]),t[1])
         #end for
+        assert_equals(list(self.getSplineWearLifeFactor(\
+                                    np.array([t[0] for t in testList]))),\
+                      [t[1] for t in testList])
     #end def
     
     def test_AllowableCompressStress(self):
@@ -1181,6 +1995,10 @@ class DudleyMethodSpline(object):
         assert_almost_equals(\
             self.getAllowableCompressiveStress(2.,3.,5.,flexible=False),\
             0.133333, places=4)
+        flexArray = self.getAllowableCompressiveStress(2.,3.,5.,\
+                                        flexible=np.array([True,False]))
+        assert_almost_equals(flexArray[0],1.2,places=1)
+        assert_almost_equals(flexArray[1],0.133333,places=4)
     #end def
     
     def test_BurstingRadialStress(self):
@@ -1191,6 +2009,11 @@ class DudleyMethodSpline(object):
             self.getBurstingRadialStress(2.,3.,5.,7.,11.)*1.0e5,\
                              -23.5709,\
                              places=4)
+        radial = self.getBurstingRadialStress(2.,np.array([3.,0.5]),5.,7.,11.)
+        assert_almost_equals(radial[0]*1.0e5,-23.5709,places=4)
+        assert_almost_equals(radial[1],\
+                             self.getBurstingRadialStress(2.,0.5,5.,7.,11.),\
+                             places=12)
     #end def
     
     def test_BurstingCentrifugalStress(self):
@@ -1238,6 +2061,12 @@ class DudleyMethodSpline(object):
                                  tl[2],\
                                  places=4)
         #end for
+        stresses = self.getAllowableBurstingStressByHardness(\
+                                    np.array([35.,49.,60.]),hType=HType(1))
+        for i,h in enumerate([35.,49.,60.]):
+            assert_equals(stresses[i],\
+                self.getAllowableBurstingStressByHardness(h,'Rockwell C'))
+        #end for
     #end def
     
     def test_BurstingSafetyFactor(self):
@@ -1247,8 +2076,177 @@ class DudleyMethodSpline(object):
         assert_equals(self.getBurstingSafetyFactor(2.,3.,5.),7.5)
     #end def
     
+    def test_CalculateBatch(self):
+        """Test the batch calculation against the single spline calculation
+        
+        """
+        inputs = {'t':[1000.,1500.],\
+                  'dRe':[0.04,0.045],\
+                  'supplyShockType':[2,0],\
+                  'loadShockType':[0,3],\
+                  'n':[3000,1500],\
+                  'nCyc':[9999,2.0e5],\
+                  'nTotal':[1.0e9,5.0e6],\
+                  'hardness':[60.,240.],\
+                  'd':[0.05,0.055],\
+                  'z':[24,30],\
+                  'fE':[0.03,0.06],\
+                  'tC':[0.0035,0.003],\
+                  'relativeMisalignment':[0.0015,0.005],\
+                  'h':[0.002,0.0018],\
+                  'phi':[0.5236,0.5236],\
+                  'tW':[0.01,0.012],\
+                  'f':[0.03,0.06],\
+                  'dOi':[0.08,0.09],\
+                  'dRi':[0.052,0.057],\
+                  'dH':[0.0,0.015],\
+                  'hType':['Rockwell C','Brinell'],\
+                  'reversible':[False,True],\
+                  'toothEnd':['Straight','Crowned'],\
+                  'flexible':[True,False]}
+        res = DudleyMethodSpline.calculateBatch(inputs)
+        resParallel = DudleyMethodSpline.evaluateBatch(inputs)
+        for i in range(2):
+            dms = DudleyMethodSpline(**dict((k,v[i]) \
+                                            for k,v in inputs.items()))
+            for k in ['shaftSafetyFactor',\
+                      'teethSafetyFactor',\
+                      'compSafetyFactor',\
+                      'burstSafetyFactor']:
+                assert_almost_equals(res[k][i],getattr(dms,'_'+k),places=8)
+                assert_almost_equals(resParallel[k][i],getattr(dms,'_'+k),\
+                                     places=8)
+            #end for
+        #end for
+        codes = dict(inputs,\
+                     hType=[HType.ROCKWELL_C,HType.BRINELL],\
+                     toothEnd=[ToothEnd.STRAIGHT,ToothEnd.CROWNED])
+        for batch in [DudleyMethodSpline.calculateBatch,\
+                      DudleyMethodSpline.evaluateBatch]:
+            resNames = batch(inputs)
+            resCodes = batch(codes)
+            for k in ['shaftSafetyFactor',\
+                      'teethSafetyFactor',\
+                      'compSafetyFactor',\
+                      'burstSafetyFactor']:
+                assert_equals(list(resCodes[k]),list(resNames[k]))
+            #end for
+        #end for
+        inputs['supplyShockType'] = [2,3]
+        for batch in [DudleyMethodSpline.calculateBatch,\
+                      DudleyMethodSpline.evaluateBatch]:
+            try:
+                batch(inputs)
+            except UnrecognisedShockTypeException:
+                pass
+            else:
+                raise AssertionError('UnrecognisedShockTypeException '+\
+                                     'not raised')
+            #end try
+        #end for
+    #end def
+    
+    def test_CalculateBatchGrid(self):
+        """Test that the batch inputs broadcast into a grid of designs
+        
+        """
+        t = np.array([[800.],[1200.]])
+        dRe = np.array([0.035,0.04,0.045])
+        inputs = {'t':t,\
+                  'dRe':dRe,\
+                  'supplyShockType':2,\
+                  'loadShockType':0,\
+                  'n':3000,\
+                  'nCyc':9999,\
+                  'nTotal':1.0e9,\
+                  'hardness':60.,\
+                  'd':0.05,\
+                  'z':24,\
+                  'fE':0.03,\
+                  'tC':0.0035,\
+                  'relativeMisalignment':0.0015,\
+                  'h':0.002,\
+                  'phi':0.5236,\
+                  'tW':0.01,\
+                  'f':0.03,\
+                  'dOi':0.08,\
+                  'dRi':0.052,\
+                  'hType':'Rockwell C'}
+        for batch in [DudleyMethodSpline.calculateBatch,\
+                      DudleyMethodSpline.evaluateBatch]:
+            res = batch(inputs)
+            assert_equals(res['burstSafetyFactor'].shape,(2,3))
+            for i in range(2):
+                for j in range(3):
+                    single = dict(inputs,t=t[i,0],dRe=dRe[j])
+                    dms = DudleyMethodSpline(**single)
+                    assert_almost_equals(res['shaftSafetyFactor'][i,j],\
+                                         dms._shaftSafetyFactor,\
+                                         places=8)
+                    assert_almost_equals(res['burstSafetyFactor'][i,j],\
+                                         dms._burstSafetyFactor,\
+                                         places=8)
+                #end for
+            #end for
+        #end for
+    #end def
+    
+    def test_CalculateMemoised(self):
+        """Test that calculate only reruns when the inputs have changed
+        
+        """
+        dms = DudleyMethodSpline(1000.,0.04,2,0,3000,9999,1.0e9,60.,0.05,\
+                                 24,0.03,0.0035,0.0015,0.002,0.5236,0.01,\
+                                 0.03,0.08,0.052,hType='Rockwell C')
+        shaftStress = dms._shaftStress
+        dms._shaftStress = None
+        dms.calculate()
+        assert_equals(dms._shaftStress,None)
+        dms._t = 2000.
+        dms.calculate()
+        assert_almost_equals(dms._shaftStress,2.*shaftStress,places=4)
+        dms._toothEnd = 'Crowned'
+        dms.calculate()
+        assert_equals(dms._allowCompStress,\
+                      self.getAllowableCompressiveStressForSplines(\
+                          60.,hType='Rockwell C',toothEnd='Crowned'))
+    #end def
+    
+    def test_CalculateZeroDimensional(self):
+        """Test that 0-d array inputs give the same results as scalars
+        
+        """
+        inputs = [1000.,0.04,2,0,3000,9999,1.0e9,60.,0.05,24,0.03,0.0035,\
+                  0.0015,0.002,0.5236,0.01,0.03,0.08,0.052]
+        dms = DudleyMethodSpline(*inputs,hType='Rockwell C')
+        dms0d = DudleyMethodSpline(*[np.array(i) for i in inputs],\
+                                   hType='Rockwell C')
+        assert_equals(dms0d._shaftSafetyFactor,dms._shaftSafetyFactor)
+        assert_equals(dms0d._teethSafetyFactor,dms._teethSafetyFactor)
+        assert_equals(dms0d._compSafetyFactor,dms._compSafetyFactor)
+        assert_equals(dms0d._burstSafetyFactor,dms._burstSafetyFactor)
+        dms0d.calculate()
+        assert_equals(dms0d._shaftSafetyFactor,dms._shaftSafetyFactor)
+    #end def
+
 #end class
 
+def assert_equals(first,second):
+    """Assert that two values are equal, as :func:`nose.tools.assert_equals`
+    
+    """
+    assert first == second, '{0} != {1}'.format(first,second)
+#end def
+
+def assert_almost_equals(first,second,places=7):
+    """Assert that two values are equal when rounded to the given number of \
+    decimal places, as :func:`nose.tools.assert_almost_equals`
+    
+    """
+    assert round(abs(second-first),places) == 0, \
+        '{0} != {1} within {2} places'.format(first,second,places)
+#end def
+
 class Test_DudleyMethodSpline(DudleyMethodSpline):
     """Test version of the Dudley Method Spline
     
@@ -1259,7 +2257,7 @@ class Test_DudleyMethodSpline(DudleyMethodSpline):
         
         """
         super(Test_DudleyMethodSpline,self).\
-            __init__(0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,\
+            __init__(0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,\
                                  autoCalc=False)
     #end def
     
@@ -1272,220 +2270,28 @@ class UnrecognisedHardnessTypeException(Exception):
 #end class
 
 class UnrecognisedToothEndException(Exception):
-    """Exception thrown when the provided hardness type is not recognised
+    """Exception thrown when the provided tooth end design is not recognised
     
     """
 #end class
-    
-import wx
-import GUIComponents.Panels as Panels
-from GUIComponents.Base import *
 
-class DMSViewer(wx.Frame):
-    """Simple viewer GUI for use of the Dudley Method Spline Calculation
+class UnrecognisedShockTypeException(Exception):
+    """Exception thrown when a supply or load shock type code is outside \
+    the application factor table
     
     """
-    
-    def __init__(self):
-        """Constructor
-        
-        """
-        super(DMSViewer,self).__init__(None,\
-                                         -1,\
-                                         'Spline Calculation - '+\
-                                         'Dudley Method',\
-                                         size=wx.Size(800,1200))
-        self._parent = None
-        self.SetBackgroundColour(wx.Colour(234,232,232))
-        self.SetForegroundColour(wx.Colour(48,61,67))
-        
-        self._splitter = Panels.CoxSplitterWindow(self)
-        self._inputForm = DMSEntryPanel(self._splitter)
-        self._outputText = Panels.DataProcessingPanel(self._splitter,\
-                                                      wx.NewId())
-        self._splitter.SplitHorizontally(self._inputForm,self._outputText,720)
-        self._inputForm._mainSizer.Layout()
-        self._outputText._mainSizer.Layout()
-        self.Layout()
-    #end def
-    
 #end class
 
-class DMSEntryPanel(Panels.BasePanel):
-    """Panel for the entry of data for the Dudley Method to calculate spline \
-    strength
+class HardnessOutOfRangeException(Exception):
+    """Exception thrown when the hardness is beyond the allowable stress \
+    tables
     
     """
+#end class
+
+class WearLifeOutOfRangeException(Exception):
+    """Exception thrown when the total revolutions of a flexible spline are \
+    beyond the wear life factor table
     
-    def __init__(self,parent):
-        """Setup the panel
-        
-        """
-        super(DMSEntryPanel,self).__init__(parent,\
-                         wx.NewId(),\
-                         'Spline Stress Calculation - Dudley Method')
-    #end def
-    
-    def contentSetup(self):
-        """Set up the content of the panel
-        
-        """
-        preamble = 'This application allows the calculation of spline strength'
-        preamble += ' using the Dudley Method. This is a basic calculation,'
-        preamble += 'but is the industry standard'
-        self.addPreText(preamble)
-        self._geomTitle = FormLabel(self,\
-                                    self._mainSizer,\
-                                    'Spline Geometry')
-        self._geomTitle.addToSizer()
-        self._geomEntry = FormNumericTextEntry(self,\
-                ['Bore Diameter, Dh [m]',\
-                 'Outside Diameter of Shaft, Doi [m]',\
-                 'Pitch Diameter, D [m]',\
-                 'Root Diameter of the Shaft, Dre [m]',\
-                 'Inner Diameter of the Hub Teeth, [m]',\
-                 'Outside Diameter of the Shaft Teeth, Dri [m]',\
-                 'Relative Misalignment of Shaft/Hub (misalignment/pitch), []',\
-                 'Length of the teeth contact, F [m]',\
-                 'Tooth chordal thickness, tC [m]',\
-                 'Number of teeth, z []',\
-                 'Pressure angle, phi [deg]',\
-                 'Hub wall thickness, tW [m]'\
-                 ],\
-                 self._mainSizer,\
-                 alignment=wx.LEFT,\
-                 allowNeg=False)
-        self._geomEntry.addToSizer()
-        self._separators = []
-        self._separators.append(FormHorizontalLine(self,\
-                                                   self._mainSizer))
-        self._separators[-1].addToSizer()
-        self._torqTitle = FormLabel(self,\
-                                    self._mainSizer,\
-                                    'Mechanical Load')
-        self._torqTitle.addToSizer()
-        self._torqEntry = FormNumericTextEntry(self,\
-                                         ['Torque, T [Nm]',\
-                                          'Shaft Speed, n [rev/min]'],\
-                                         self._mainSizer,\
-                                         alignment=wx.LEFT,\
-                                         allowNeg=False)
-        self._torqEntry.addToSizer()
-        self._separators.append(FormHorizontalLine(self,\
-                                                   self._mainSizer))
-        self._separators[-1].addToSizer()
-        self._factDataTitle = FormLabel(self,\
-                                        self._mainSizer,\
-                                        'General Data')
-        self._factDataTitle.addToSizer()
-        self._hardness = ['Brinell 160-200',\
-                           'Brinell 230-260',\
-                           'Brinell 302-351',\
-                           'Rockwell C 33-38',\
-                           'Rockwell C 42-46',\
-                           'Rockwell C 48-53',\
-                           'Rockwell C 58-63']
-        self._powerSources = ['Uniform (turbine,motor)',\
-                              'Light shock (hydraulic motor)',\
-                              'Medium shock (internal combustion engine)']
-        self._loadTypes = ['Uniform (generator,fan)',\
-                           'Light Shock (oscillating, pump,etc.)',\
-                           'Intermittent Shock(actuating pumps, etc)',\
-                           'Heavy Shock,(punches, shears, etc)']
-        self._torqCycs = ['< 1E3','< 1E4','< 1E5','< 1E6','< 1E7']
-        self._revs = ['< 1E4','< 1E5','< 1E6','< 1E7','< 1E8','< 1E9','< 1E10']
-        self._rot = ['Unidirectional','Fully-reversed']
-        self._toothProf = ['Straight','Crowned']
-        self._factDataEntry = FormSelection(self,\
-                                            ['Material Hardness',\
-                                             'Power Source',\
-                                             'Load Type',\
-                                             'No. of Torque Cycles',\
-                                             'No. of Revolutions',\
-                                             'Rotation Direction',\
-                                             'Tooth profile',\
-                                             'Flexible?'],\
-                                             [self._hardness,\
-                                              self._powerSources,\
-                                              self._loadTypes,\
-                                              self._torqCycs,\
-                                              self._revs,\
-                                              self._rot,\
-                                              self._toothProf,\
-                                              ['Yes','No']],\
-                                            self._mainSizer,\
-                                            defaultChoices = \
-                        ['Rockwell C 58-63',\
-                         'Medium shock (internal combustion engine)',\
-                         'Uniform (generator,fan)',\
-                         '< 1E4',\
-                         '< 1E10',\
-                         'Unidirectional',\
-                         'Straight',\
-                         'Yes'],\
-                                            alignment = wx.LEFT)
-        self._factDataEntry.addToSizer()
-        self._separators.append(FormHorizontalLine(self,\
-                                                   self._mainSizer))
-        self._separators[-1].addToSizer()
-        self._tailButtons = FormEndButtons(self,\
-                                           'Calculate',\
-                                           self.calculateDudley,\
-                                           self._tailSizer)
-        self._tailButtons.addToSizer()
-    #end def
-    
-    def calculateDudley(self,item):
-        """Use the entry data to calculate the spline stresses and safety \
-        factors
-        
-        :param item: Item that launched the method
-        :type item: wx.CommandButton
-        
-        """
-        geomData = self._geomEntry.getValues()
-        torqData = self._torqEntry.getValues()
-        factData = self._factDataEntry.getValues()
-        hardnessReference = [['Brinell',180],\
-                             ['Brinell',240],\
-                             ['Brinell',320],\
-                             ['Rockwell C',35],\
-                             ['Rockwell C',44],\
-                             ['Rockwell C',50],\
-                             ['Rockwell C',60]]
-        
-        hardness = \
-            hardnessReference[self._hardness.index(\
-                                            factData['Material Hardness'])]
-        dms = DudleyMethodSpline(\
-                torqData['Torque, T [Nm]'],\
-                geomData['Root Diameter of the Shaft, Dre [m]'],\
-                self._powerSources.index(factData['Power Source']),\
-                self._loadTypes.index(factData['Load Type']),\
-                torqData['Shaft Speed, n [rev/min]'],\
-                10**float(factData['No. of Torque Cycles'].split('E')[1])-1,\
-                10**float(factData['No. of Revolutions'].split('E')[1])-1,\
-                hardness[1],\
-                geomData['Pitch Diameter, D [m]'],\
-                geomData['Number of teeth, z []'],\
-                geomData['Length of the teeth contact, F [m]'],\
-                geomData['Tooth chordal thickness, tC [m]'],\
-                geomData[\
-                'Relative Misalignment of Shaft/Hub (misalignment/pitch), []'],\
-                (geomData['Outside Diameter of the Shaft Teeth, Dri [m]']-\
-                geomData['Inner Diameter of the Hub Teeth, [m]'])/2.0,\
-                np.deg2rad(geomData['Pressure angle, phi [deg]']),\
-                geomData['Hub wall thickness, tW [m]'],\
-                geomData['Length of the teeth contact, F [m]'],\
-                geomData['Outside Diameter of Shaft, Doi [m]'],\
-                geomData['Outside Diameter of the Shaft Teeth, Dri [m]'],\
-                dH=geomData['Bore Diameter, Dh [m]'],\
-                hType=hardness[0],\
-                reversible=(factData['Rotation Direction'] \
-                                            == 'Fully-reversed'),\
-                toothEnd=factData['Tooth profile'],\
-                flexible=(factData['Flexible?']=='Yes'))
-        self._parent._parent._outputText.printToLog(str(dms))
-    #end def
-    
+    """
 #end class
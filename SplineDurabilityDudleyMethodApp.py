@@ -6,13 +6,15 @@ Created on Tue Mar 27 14:55:48 2018
 
 """
 
-import wx
-from StandardCalcs.SplineDurabilityDudleyMethod import DMSViewer
-
 def launch():
     """Basic function to launch the application
     
+    wx and the GUI are imported here rather than at module level so that
+    importing this module stays cheap
+    
     """
+    import wx
+    from StandardCalcs.SplineDurabilityDudleyMethodGUI import DMSViewer
     
     appBE = wx.App()
     dmsView = DMSViewer()
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""GUI for the Dudley Method Spline Durability Calculation
+
+Kept apart from :mod:`SplineDurabilityDudleyMethod` so the calculation can be
+imported for batch work without wx
+
+Created on Thu Oct 15 09:12:31 2026
+
+.. codeauthor:: Euan Freeman <euan.freeman@coxpowertrain.com>
+
+"""
+
+import math
+from functools import lru_cache
+import wx
+import GUIComponents.Panels as Panels
+from GUIComponents.Base import *
+from StandardCalcs.SplineDurabilityDudleyMethod import DudleyMethodSpline, \
+    HType, ToothEnd
+
+@lru_cache(maxsize=128)
+def _dudleyReport(*args,**kwargs):
+    """Calculate a spline and return its text report, cached on the inputs \
+    so pressing Calculate again on unchanged entries is a look up
+    
+    :param args: Positional arguments of :class:`DudleyMethodSpline`
+    :param kwargs: Keyword arguments of :class:`DudleyMethodSpline`
+    
+    :returns: Returns the report of the calculated spline
+    :rtype: str
+    
+    """
+    return str(DudleyMethodSpline(*args,**kwargs))
+#end def
+
+class DMSViewer(wx.Frame):
+    """Simple viewer GUI for use of the Dudley Method Spline Calculation
+    
+    """
+    
+    def __init__(self):
+        """Constructor
+        
+        """
+        super(DMSViewer,self).__init__(None,\
+                                         -1,\
+                                         'Spline Calculation - '+\
+                                         'Dudley Method',\
+                                         size=wx.Size(800,1200))
+        self._parent = None
+        self.SetBackgroundColour(wx.Colour(234,232,232))
+        self.SetForegroundColour(wx.Colour(48,61,67))
+        
+        self._splitter = Panels.CoxSplitterWindow(self)
+        self._inputForm = DMSEntryPanel(self._splitter)
+        self._outputText = Panels.DataProcessingPanel(self._splitter,\
+                                                      wx.NewId())
+        self._splitter.SplitHorizontally(self._inputForm,self._outputText,720)
+        self._inputForm._mainSizer.Layout()
+        self._outputText._mainSizer.Layout()
+        self.Layout()
+    #end def
+    
+#end class
+
+class DMSEntryPanel(Panels.BasePanel):
+    """Panel for the entry of data for the Dudley Method to calculate spline \
+    strength
+    
+    """
+    
+    #: Hardness type and reference hardness for each 'Material Hardness' choice
+    _HARDNESS_MAP = {'Brinell 160-200':(HType.BRINELL,180),\
+                     'Brinell 230-260':(HType.BRINELL,240),\
+                     'Brinell 302-351':(HType.BRINELL,320),\
+                     'Rockwell C 33-38':(HType.ROCKWELL_C,35),\
+                     'Rockwell C 42-46':(HType.ROCKWELL_C,44),\
+                     'Rockwell C 48-53':(HType.ROCKWELL_C,50),\
+                     'Rockwell C 58-63':(HType.ROCKWELL_C,60)}
+    #: Tooth end code for each 'Tooth profile' choice
+    _TOOTH_END_MAP = {'Straight':ToothEnd.STRAIGHT,\
+                      'Crowned':ToothEnd.CROWNED}
+    #: Shaft life in torque cycles for each 'No. of Torque Cycles' choice
+    _TORQCYC_MAP = {'< 1E3':999.,\
+                    '< 1E4':9999.,\
+                    '< 1E5':99999.,\
+                    '< 1E6':999999.,\
+                    '< 1E7':9999999.}
+    #: Total revolutions for each 'No. of Revolutions' choice
+    _REVS_MAP = {'< 1E4':9999.,\
+                 '< 1E5':99999.,\
+                 '< 1E6':999999.,\
+                 '< 1E7':9999999.,\
+                 '< 1E8':99999999.,\
+                 '< 1E9':999999999.,\
+                 '< 1E10':9999999999.}
+    #: Choices offered by the general data selection
+    _HARDNESS = tuple(_HARDNESS_MAP)
+    _POWER_SOURCES = ('Uniform (turbine,motor)',\
+                      'Light shock (hydraulic motor)',\
+                      'Medium shock (internal combustion engine)')
+    _LOAD_TYPES = ('Uniform (generator,fan)',\
+                   'Light Shock (oscillating, pump,etc.)',\
+                   'Intermittent Shock(actuating pumps, etc)',\
+                   'Heavy Shock,(punches, shears, etc)')
+    _TORQ_CYCS = tuple(_TORQCYC_MAP)
+    _REVS = tuple(_REVS_MAP)
+    _ROT = ('Unidirectional','Fully-reversed')
+    _TOOTH_PROF = tuple(_TOOTH_END_MAP)
+    
+    def __init__(self,parent):
+        """Setup the panel
+        
+        """
+        super(DMSEntryPanel,self).__init__(parent,\
+                         wx.NewId(),\
+                         'Spline Stress Calculation - Dudley Method')
+    #end def
+    
+    def contentSetup(self):
+        """Set up the content of the panel
+        
+        """
+        preamble = 'This application allows the calculation of spline strength'
+        preamble += ' using the Dudley Method. This is a basic calculation,'
+        preamble += 'but is the industry standard'
+        self.addPreText(preamble)
+        self._geomTitle = FormLabel(self,\
+                                    self._mainSizer,\
+                                    'Spline Geometry')
+        self._geomTitle.addToSizer()
+        self._geomEntry = FormNumericTextEntry(self,\
+                ['Bore Diameter, Dh [m]',\
+                 'Outside Diameter of Shaft, Doi [m]',\
+                 'Pitch Diameter, D [m]',\
+                 'Root Diameter of the Shaft, Dre [m]',\
+                 'Inner Diameter of the Hub Teeth, [m]',\
+                 'Outside Diameter of the Shaft Teeth, Dri [m]',\
+                 'Relative Misalignment of Shaft/Hub (misalignment/pitch), []',\
+                 'Length of the teeth contact, F [m]',\
+                 'Tooth chordal thickness, tC [m]',\
+                 'Number of teeth, z []',\
+                 'Pressure angle, phi [deg]',\
+                 'Hub wall thickness, tW [m]'\
+                 ],\
+                 self._mainSizer,\
+                 alignment=wx.LEFT,\
+                 allowNeg=False)
+        self._geomEntry.addToSizer()
+        self._separators = []
+        self._separators.append(FormHorizontalLine(self,\
+                                                   self._mainSizer))
+        self._separators[-1].addToSizer()
+        self._torqTitle = FormLabel(self,\
+                                    self._mainSizer,\
+                                    'Mechanical Load')
+        self._torqTitle.addToSizer()
+        self._torqEntry = FormNumericTextEntry(self,\
+                                         ['Torque, T [Nm]',\
+                                          'Shaft Speed, n [rev/min]'],\
+                                         self._mainSizer,\
+                                         alignment=wx.LEFT,\
+                                         allowNeg=False)
+        self._torqEntry.addToSizer()
+        self._separators.append(FormHorizontalLine(self,\
+                                                   self._mainSizer))
+        self._separators[-1].addToSizer()
+        self._factDataTitle = FormLabel(self,\
+                                        self._mainSizer,\
+                                        'General Data')
+        self._factDataTitle.addToSizer()
+        self._factDataEntry = FormSelection(self,\
+                                            ['Material Hardness',\
+                                             'Power Source',\
+                                             'Load Type',\
+                                             'No. of Torque Cycles',\
+                                             'No. of Revolutions',\
+                                             'Rotation Direction',\
+                                             'Tooth profile',\
+                                             'Flexible?'],\
+                                             [self._HARDNESS,\
+                                              self._POWER_SOURCES,\
+                                              self._LOAD_TYPES,\
+                                              self._TORQ_CYCS,\
+                                              self._REVS,\
+                                              self._ROT,\
+                                              self._TOOTH_PROF,\
+                                              ('Yes','No')],\
+                                            self._mainSizer,\
+                                            defaultChoices = \
+                        ['Rockwell C 58-63',\
+                         'Medium shock (internal combustion engine)',\
+                         'Uniform (generator,fan)',\
+                         '< 1E4',\
+                         '< 1E10',\
+                         'Unidirectional',\
+                         'Straight',\
+                         'Yes'],\
+                                            alignment = wx.LEFT)
+        self._factDataEntry.addToSizer()
+        self._separators.append(FormHorizontalLine(self,\
+                                                   self._mainSizer))
+        self._separators[-1].addToSizer()
+        self._tailButtons = FormEndButtons(self,\
+                                           'Calculate',\
+                                           self.calculateDudley,\
+                                           self._tailSizer)
+        self._tailButtons.addToSizer()
+    #end def
+    
+    def calculateDudley(self,item):
+        """Use the entry data to calculate the spline stresses and safety \
+        factors
+        
+        :param item: Item that launched the method
+        :type item: wx.CommandButton
+        
+        """
+        geomData = self._geomEntry.getValues()
+        torqData = self._torqEntry.getValues()
+        factData = self._factDataEntry.getValues()
+        hType,hardness = self._HARDNESS_MAP[factData['Material Hardness']]
+        fE = geomData['Length of the teeth contact, F [m]']
+        dRi = geomData['Outside Diameter of the Shaft Teeth, Dri [m]']
+        reversible = factData['Rotation Direction'] == 'Fully-reversed'
+        flexible = factData['Flexible?'] == 'Yes'
+        report = _dudleyReport(\
+                torqData['Torque, T [Nm]'],\
+                geomData['Root Diameter of the Shaft, Dre [m]'],\
+                self._POWER_SOURCES.index(factData['Power Source']),\
+                self._LOAD_TYPES.index(factData['Load Type']),\
+                torqData['Shaft Speed, n [rev/min]'],\
+                self._TORQCYC_MAP[factData['No. of Torque Cycles']],\
+                self._REVS_MAP[factData['No. of Revolutions']],\
+                hardness,\
+                geomData['Pitch Diameter, D [m]'],\
+                geomData['Number of teeth, z []'],\
+                fE,\
+                geomData['Tooth chordal thickness, tC [m]'],\
+                geomData[\
+                'Relative Misalignment of Shaft/Hub (misalignment/pitch), []'],\
+                (dRi-geomData['Inner Diameter of the Hub Teeth, [m]'])/2.0,\
+                math.radians(geomData['Pressure angle, phi [deg]']),\
+                geomData['Hub wall thickness, tW [m]'],\
+                fE,\
+                geomData['Outside Diameter of Shaft, Doi [m]'],\
+                dRi,\
+                dH=geomData['Bore Diameter, Dh [m]'],\
+                hType=hType,\
+                reversible=reversible,\
+                toothEnd=self._TOOTH_END_MAP[factData['Tooth profile']],\
+                flexible=flexible)
+        wx.CallAfter(self.logReport,report)
+    #end def
+    
+    def logReport(self,report):
+        """Print the report of a calculated spline to the output log, with \
+        the log frozen so it repaints once
+        
+        :param report: The report of the calculated spline
+        :type report: str
+        
+        """
+        log = self._parent._parent._outputText
+        log.Freeze()
+        try:
+            log.printToLog(report)
+        finally:
+            log.Thaw()
+        #end try
+    #end def
+    
+#end class